@@ -52,12 +52,16 @@ Author: Ludo Game Developer
 """
 
 import random
-from typing import List, Tuple
+import sys
+from bisect import insort
+from typing import List, Optional, Tuple
 
 
 class Player:
     """Represents a player in the Ludo game."""
 
+    __slots__ = ("name", "start_index", "board_length", "step", "_track")
+
     def __init__(self, name: str, start_index: int, board_length: int) -> None:
         self.name = name
         self.start_index = start_index
@@ -66,6 +70,9 @@ class Player:
         # step >= 0 means the token is on the board
         # step == board_length means the token has completed a full lap
         self.step: int = -1
+        # Absolute square for every step of the lap, fixed once the start
+        # index and board length are known.
+        self._track: List[int] = [(start_index + step) % board_length for step in range(board_length)]
 
     @property
     def is_finished(self) -> bool:
@@ -90,7 +97,7 @@ class Player:
         """
         if self.step < 0 or self.is_finished:
             return -1
-        return (self.start_index + self.step) % self.board_length
+        return self._track[self.step]
 
     def __repr__(self) -> str:  # pragma: no cover - debugging helper
         return f"Player(name={self.name!r}, step={self.step}, abs_pos={self.absolute_position()})"
@@ -106,61 +113,97 @@ class LudoGame:
     opponent back to the yard.  The first player to complete a lap wins.
     """
 
-    def __init__(self, players: List[Player], board_length: int = 52) -> None:
+    def __init__(self, players: List[Player], board_length: int = 52, verbose: bool = False,
+                 seed: Optional[int] = None) -> None:
         self.players = players
         self.board_length = board_length
         self.current_index = 0
+        # Narrate each turn on stdout; off by default so the engine can be
+        # driven by a bot or simulation without any I/O cost.
+        self.verbose = verbose
+        # Private generator so games can be seeded and reproduced; rolls draw
+        # raw bits from it, which is cheaper than randint.
+        self._rng = random.Random(seed)
+        self._getrandbits = self._rng.getrandbits
         # History of turns for debugging or future enhancements
         self.turn_history: List[Tuple[str, int]] = []
+        # Reverse index from absolute board position to the indices of the
+        # players whose tokens are there, in turn order.  Kept up to date on
+        # every move so a capture is a single lookup and leaving a shared
+        # square needs no rescan.
+        self._pos_to_players: List[List[int]] = [[] for _ in range(board_length)]
+        for index, p in enumerate(players):
+            if p.on_board:
+                self._pos_to_players[p.absolute_position()].append(index)
 
     def roll_die(self) -> int:
         """Roll a six‑sided die and return the value (1–6)."""
-        return random.randint(1, 6)
+        # Draw 3 bits (0–7) and reject 6 and 7 so every face is equally likely
+        value = self._getrandbits(3)
+        while value >= 6:
+            value = self._getrandbits(3)
+        return value + 1
 
-    def play_turn(self, player: Player) -> bool:
+    def play_turn(self, player: Player, player_index: Optional[int] = None) -> bool:
         """
         Handle a single player's turn.
 
-        Returns True if the player gets another turn (i.e., rolled a 6),
-        otherwise False.
+        ``player_index`` is the player's position in :attr:`players`; it is
+        looked up when not given.  Returns True if the player gets another
+        turn (i.e., rolled a 6), otherwise False.
         """
         if player.is_finished:
             return False
 
+        board_length = self.board_length
+        if player_index is None:
+            player_index = self.players.index(player)
+        pos_to_players = self._pos_to_players
         roll = self.roll_die()
-        print(f"\n{player.name}'s turn. You rolled a {roll}.")
+        if self.verbose:
+            print(f"\n{player.name}'s turn. You rolled a {roll}.")
         self.turn_history.append((player.name, roll))
 
-        # If the token is in the yard
+        # Commonest early-game case first: stuck in the yard, nothing changes
+        if player.step < 0 and roll != 6:
+            if self.verbose:
+                print(f"{player.name}'s token is still in the yard. You need a 6 to move out.")
+            return False
+
+        # If the token is in the yard (and a 6 was rolled)
         if player.step < 0:
-            if roll == 6:
-                player.step = 0  # move token onto the board
+            player.step = 0  # move token onto the board
+            insort(pos_to_players[player.absolute_position()], player_index)
+            if self.verbose:
                 print(f"{player.name} rolled a 6 and moved out of the yard!")
-            else:
-                print(f"{player.name}'s token is still in the yard. You need a 6 to move out.")
-                return False
         else:
             proposed_step = player.step + roll
-            if proposed_step > self.board_length:
+            if proposed_step > board_length:
                 # Overshoot: cannot move
-                print(f"{player.name} cannot move because you'd overshoot the finish.")
-            elif proposed_step == self.board_length:
+                if self.verbose:
+                    print(f"{player.name} cannot move because you'd overshoot the finish.")
+            elif proposed_step == board_length:
                 # Finish the lap
-                player.step = self.board_length
-                print(f"{player.name} has completed a full lap and wins the game! Congratulations!")
+                pos_to_players[player.absolute_position()].remove(player_index)
+                player.step = board_length
+                if self.verbose:
+                    print(f"{player.name} has completed a full lap and wins the game! Congratulations!")
                 return False
             else:
                 # Move token forward
+                pos_to_players[player.absolute_position()].remove(player_index)
                 player.step = proposed_step
-                print(f"{player.name} moves to step {player.step} (absolute position {player.absolute_position()}).")
-                # Check for captures
-                for other in self.players:
-                    if other is player or not other.on_board:
-                        continue
-                    if other.absolute_position() == player.absolute_position():
-                        other.step = -1
+                new_abs_pos = player.absolute_position()
+                if self.verbose:
+                    print(f"{player.name} moves to step {player.step} (absolute position {new_abs_pos}).")
+                # Check for captures: the first opponent (in turn order) on the square
+                occupants = pos_to_players[new_abs_pos]
+                if occupants:
+                    other = self.players[occupants.pop(0)]
+                    other.step = -1
+                    if self.verbose:
                         print(f"{player.name} captured {other.name}'s token! {other.name}'s token is sent back to the yard.")
-                        break
+                insort(occupants, player_index)
 
         # Return True for extra turn when rolling a 6 and not finishing
         return roll == 6
@@ -174,17 +217,21 @@ class LudoGame:
                 # Represent each player by the first letter of their name
                 positions[abs_pos] = p.name[0].upper()
         track = ''.join(positions)
-        print(f"Board: {track}")
+        lines: List[str] = [f"Board: {track}"]
         for p in self.players:
             status = "finished" if p.is_finished else ("in yard" if p.step < 0 else f"step {p.step}, abs {p.absolute_position()}")
-            print(f"  {p.name}: {status}")
+            lines.append(f"  {p.name}: {status}")
+        lines.append("")
+        # Emit the whole frame with one write instead of one print per line
+        sys.stdout.write("\n".join(lines))
 
     def play(self) -> None:
         """Run the game loop until someone wins."""
         while True:
             player = self.players[self.current_index]
-            extra_turn = self.play_turn(player)
-            self.print_board()
+            extra_turn = self.play_turn(player, self.current_index)
+            if self.verbose:
+                self.print_board()
             # Check if someone has finished
             if player.is_finished:
                 break
@@ -223,7 +270,7 @@ def setup_game() -> LudoGame:
     board_length = 52
     start_positions = [0, 13, 26, 39]
     players = [Player(name, start_positions[i], board_length) for i, name in enumerate(names)]
-    return LudoGame(players, board_length)
+    return LudoGame(players, board_length, verbose=True)
 
 
 def main() -> None:
@@ -36,49 +36,17 @@ interface.  Feel free to extend it with a GUI or additional features.
 """
 
 import random
-from typing import List, Optional, Tuple
-
-
-class Token:
-    """Represents a single Ludo token (coin)."""
-
-    def __init__(self) -> None:
-        # Step encoding:
-        #  -1: token is in the yard (not yet on board)
-        #   0–51: token is on the main board track
-        #  52–57: token is in the player's home column (52 is the first home square)
-        #  57: token has reached the finish (home)
-        self.step: int = -1
-
-    @property
-    def in_yard(self) -> bool:
-        return self.step < 0
-
-    @property
-    def in_home(self) -> bool:
-        return self.step >= 52
-
-    @property
-    def is_finished(self) -> bool:
-        return self.step == 57
-
-    def absolute_position(self, start_index: int, board_length: int) -> Optional[int]:
-        """
-        Return the absolute board position (0–51) when the token is on the main
-        track.  Returns None when the token is in the yard or in the home
-        column.
-        """
-        if self.step < 0 or self.step >= 52:
-            return None
-        return (start_index + self.step) % board_length
-
-    def __repr__(self) -> str:  # pragma: no cover
-        return f"Token(step={self.step})"
+import sys
+from array import array
+from typing import Callable, Iterable, List, Optional
 
 
 class Player:
     """Represents a player in the full Ludo game."""
 
+    __slots__ = ("name", "colour", "start_index", "home_entry", "board_length", "home_length",
+                 "steps", "_on_track_mask", "_remaining", "_active_mask", "_turn_banner")
+
     def __init__(self, name: str, colour: str, start_index: int, home_entry: int, board_length: int, home_length: int = 6) -> None:
         self.name = name
         self.colour = colour
@@ -86,19 +54,59 @@ class Player:
         self.home_entry = home_entry  # index on main track just before entering home
         self.board_length = board_length
         self.home_length = home_length
-        self.tokens: List[Token] = [Token() for _ in range(4)]
+        # Steps of the player's four tokens, one signed byte per token:
+        #  -1: token is in the yard (not yet on board)
+        #   0–51: token is on the main board track
+        #  52–57: token is in the player's home column (52 is the first home square)
+        #  57: token has reached the finish (home)
+        self.steps = array('b', [-1] * 4)
+        # Bit pos is set while one of this player's tokens is on main‑track
+        # square pos; maintained by LudoGameFull as tokens move.
+        self._on_track_mask = 0
+        # Number of tokens not yet finished, and the same set as a bitmask
+        # (bit i set while token i is unfinished); kept in sync by LudoGameFull.
+        self._remaining = 4
+        self._active_mask = 0b1111
+        # Printed at the start of each of this player's turns
+        self._turn_banner = f"\n{name}'s turn ({colour})."
 
     @property
     def all_finished(self) -> bool:
         """Return True if all tokens have reached the finish."""
-        return all(tok.is_finished for tok in self.tokens)
+        return self._remaining == 0
 
     def active_tokens(self) -> List[int]:
         """Return indices of tokens that are not finished (i.e. still in play or in yard)."""
-        return [i for i, t in enumerate(self.tokens) if not t.is_finished]
+        indices: List[int] = []
+        mask = self._active_mask
+        while mask:
+            indices.append((mask & -mask).bit_length() - 1)  # lowest set bit
+            mask &= mask - 1
+        return indices
 
     def __repr__(self) -> str:  # pragma: no cover
-        return f"Player(name={self.name!r}, tokens={self.tokens})"
+        return f"Player(name={self.name!r}, steps={list(self.steps)})"
+
+
+def safe_square_mask(positions: Iterable[int]) -> int:
+    """Return a bitmask with bit ``pos`` set for every safe square in ``positions``."""
+    mask = 0
+    for pos in positions:
+        mask |= 1 << pos
+    return mask
+
+
+def _roll_die(getrandbits: Callable[[int], int]) -> int:
+    """
+    Roll a six‑sided die using ``getrandbits`` (e.g. ``random.Random().getrandbits``).
+
+    Three random bits give 0–7; 6 and 7 are rejected so every face is equally
+    likely.  This is considerably cheaper than :func:`random.randint`.
+    """
+    value = getrandbits(3)
+    while value >= 6:
+        value = getrandbits(3)
+    return value + 1
 
 
 class LudoGameFull:
@@ -109,32 +117,103 @@ class LudoGameFull:
     capturing, and victory conditions.
     """
 
-    def __init__(self, players: List[Player], board_length: int = 52, home_length: int = 6) -> None:
+    def __init__(self, players: List[Player], board_length: int = 52, home_length: int = 6, verbose: bool = False,
+                 seed: Optional[int] = None) -> None:
         self.players = players
         self.board_length = board_length
         self.home_length = home_length
+        # Last step of the home column (57 on the standard board), fixed for
+        # the whole game so move validation does not recompute it per token.
+        self._last_step = 51 + home_length
         self.current_player_index = 0
+        # Narrate moves on stdout; off by default so bots and simulations
+        # pay no I/O cost.  The interactive game turns it on.
+        self.verbose = verbose
+        # Private generator so games can be seeded and reproduced
+        self._rng = random.Random(seed)
+        self._getrandbits = self._rng.getrandbits
         # Safe squares are typically the coloured star squares.  We include the
         # starting squares for each player and the squares 8 positions ahead.
         start_positions = [p.start_index for p in players]
         second_safe = [(pos + 8) % board_length for pos in start_positions]
-        self.safe_positions = set(start_positions + second_safe)
+        self.safe_positions = frozenset(start_positions + second_safe)
+        # Same squares as a bitmask: square pos is safe when bit pos is set
+        self._safe_mask = safe_square_mask(self.safe_positions)
+        # _abs[p][step] is the absolute square of player p's token at main‑track
+        # step 0–51, so lookups avoid redoing the start offset and modulo.
+        self._abs = [array('B', [(start + step) % board_length for step in range(52)])
+                     for start in start_positions]
+        # Main‑track occupancy.  occ_count[pos] is the number of tokens on
+        # square pos; occ_owner[pos] is the index of the player owning them, or
+        # -1 when the square is empty or holds a mixed stack (safe squares only).
+        # Both are kept up to date by move_token.
+        self.occ_owner = array('b', [-1] * board_length)
+        self.occ_count = array('b', [0] * board_length)
+        self._rebuild_occupancy()
 
     def roll_die(self) -> int:
-        return random.randint(1, 6)
+        return _roll_die(self._getrandbits)
 
-    def get_board_occupants(self) -> dict:
+    def _rebuild_occupancy(self) -> None:
         """
-        Build a mapping from absolute board position (0–51) to a list of (player_index, token_index).
-        Tokens in the yard or in home columns are excluded.
+        Recompute the occupancy arrays and each player's track mask and
+        finished‑token bookkeeping from scratch from the token positions.
         """
-        occupants: dict = {}
+        for pos in range(self.board_length):
+            self.occ_owner[pos] = -1
+            self.occ_count[pos] = 0
+        for p_index, player in enumerate(self.players):
+            player._on_track_mask = 0
+            player._remaining = 0
+            player._active_mask = 0
+            for t_index, step in enumerate(player.steps):
+                if step != 57:
+                    player._remaining += 1
+                    player._active_mask |= 1 << t_index
+            abs_table = self._abs[p_index]
+            for step in player.steps:
+                if 0 <= step < 52:
+                    self._enter_square(abs_table[step], p_index)
+
+    def _square_owner(self, pos: int) -> int:
+        """Return the single player owning every token on square ``pos``, or -1."""
+        owner = -1
         for p_index, player in enumerate(self.players):
-            for t_index, tok in enumerate(player.tokens):
-                abs_pos = tok.absolute_position(player.start_index, self.board_length)
-                if abs_pos is not None:
-                    occupants.setdefault(abs_pos, []).append((p_index, t_index))
-        return occupants
+            abs_table = self._abs[p_index]
+            for step in player.steps:
+                if 0 <= step < 52 and abs_table[step] == pos:
+                    if owner not in (-1, p_index):
+                        return -1
+                    owner = p_index
+        return owner
+
+    def _enter_square(self, pos: int, player_index: int) -> None:
+        """Record a token of ``player_index`` arriving on main‑track square ``pos``."""
+        self.players[player_index]._on_track_mask |= 1 << pos
+        count = self.occ_count[pos]
+        if count == 0:
+            self.occ_owner[pos] = player_index
+        elif self.occ_owner[pos] != player_index:
+            self.occ_owner[pos] = -1
+        self.occ_count[pos] = count + 1
+
+    def _leave_square(self, pos: int, player_index: int) -> None:
+        """
+        Record a token of ``player_index`` leaving main‑track square ``pos``.
+
+        The token's step must already have been updated.
+        """
+        player = self.players[player_index]
+        if (pos - player.start_index) % self.board_length not in player.steps:
+            # No other token of this player is left on the square
+            player._on_track_mask &= ~(1 << pos)
+        count = self.occ_count[pos] - 1
+        self.occ_count[pos] = count
+        if count == 0:
+            self.occ_owner[pos] = -1
+        elif self.occ_owner[pos] == -1:
+            # A mixed stack shrank; it may now belong to a single player
+            self.occ_owner[pos] = self._square_owner(pos)
 
     def get_valid_tokens_for_roll(self, player_index: int, roll: int) -> List[int]:
         """
@@ -144,51 +223,51 @@ class LudoGameFull:
         is empty, the player cannot move any token for this roll.
         """
         player = self.players[player_index]
-        occupants = self.get_board_occupants()
+        steps = player.steps
+        # Without a 6 nothing can move while every unfinished token is in the yard
+        if roll != 6 and steps.count(-1) == player._remaining:
+            return []
+        # Hoist everything the loop reads into locals
+        abs_table = self._abs[player_index]
+        start = player.start_index
+        track_mask = player._on_track_mask
+        safe_mask = self._safe_mask
+        occ_count = self.occ_count
+        last_step = self._last_step
         valid_tokens: List[int] = []
-        for idx, tok in enumerate(player.tokens):
-            if tok.is_finished:
+        for idx, step in enumerate(steps):
+            if step == 57:
                 continue  # token already finished
             # Determine the proposed step if this token is moved
-            if tok.in_yard:
+            if step < 0:
                 if roll != 6:
                     continue  # cannot move out of yard without a 6
                 dest_step = 0
-                dest_abs = player.start_index
+                dest_abs = start
                 # Check if destination is blocked by player's own token on board
-                blocked = False
-                for other_idx, other_tok in enumerate(player.tokens):
-                    if other_idx == idx or other_tok.in_yard or other_tok.in_home:
-                        continue
-                    if other_tok.absolute_position(player.start_index, self.board_length) == dest_abs:
-                        blocked = True
-                        break
-                if blocked:
+                if (track_mask >> dest_abs) & 1:
                     continue
                 valid_tokens.append(idx)
             else:
-                dest_step = tok.step + roll
+                dest_step = step + roll
                 # Overshoot beyond final home square
-                if dest_step > 51 + self.home_length:  # >57
+                if dest_step > last_step:  # >57
                     continue
                 # Moving within main track
                 if dest_step < 52:
-                    dest_abs = (player.start_index + dest_step) % self.board_length
+                    dest_abs = abs_table[dest_step]
                     # Check if dest square is safe
-                    if dest_abs in self.safe_positions:
+                    if (safe_mask >> dest_abs) & 1:
                         # Safe: allow stacking of tokens regardless of colour
                         # Always valid (no capturing in safe squares)
                         valid_tokens.append(idx)
                         continue
-                    # Count occupants at dest
-                    occ = occupants.get(dest_abs, [])
                     # Blocked if any of your own tokens already occupy dest
-                    blocked_by_self = any(p_idx == player_index for p_idx, _ in occ)
-                    if blocked_by_self:
+                    if (track_mask >> dest_abs) & 1:
                         continue
                     # Blocked if dest has more than one opponent token
                     # or dest has two tokens of any colour (stack) on main track
-                    if len(occ) > 1:
+                    if occ_count[dest_abs] > 1:
                         continue
                     # Otherwise dest is valid (capture if exactly one opponent token)
                     valid_tokens.append(idx)
@@ -207,45 +286,60 @@ class LudoGameFull:
         Returns True if the player gets another turn (i.e. rolled a 6 or captured an opponent).
         """
         player = self.players[player_index]
-        token = player.tokens[token_index]
-        occupants = self.get_board_occupants()
+        steps = player.steps
+        old_step = steps[token_index]
+        if old_step < 0 and roll != 6:
+            return False  # a token only leaves the yard on a 6
+        abs_table = self._abs[player_index]
         extra_turn = False
         capture_occurred = False
 
-        if token.in_yard:
+        if old_step < 0:
             # Move out of yard to start square
-            token.step = 0
-            print(f"{player.name} moves a token out of the yard to the start square.")
+            steps[token_index] = 0
+            self._enter_square(player.start_index, player_index)
+            if self.verbose:
+                print(f"{player.name} moves a token out of the yard to the start square.")
             extra_turn = True  # Rolling a 6 when in yard grants another turn
         else:
-            dest_step = token.step + roll
+            dest_step = old_step + roll
+            steps[token_index] = dest_step
+            if old_step < 52:
+                self._leave_square(abs_table[old_step], player_index)
             if dest_step < 52:
-                dest_abs = (player.start_index + dest_step) % self.board_length
+                dest_abs = abs_table[dest_step]
                 # Check safe square
-                if dest_abs in self.safe_positions:
+                if (self._safe_mask >> dest_abs) & 1:
                     # No capturing in safe squares
-                    token.step = dest_step
-                    print(f"{player.name}'s token moves to safe square {dest_abs} (step {dest_step}).")
+                    self._enter_square(dest_abs, player_index)
+                    if self.verbose:
+                        print(f"{player.name}'s token moves to safe square {dest_abs} (step {dest_step}).")
                 else:
-                    occ = occupants.get(dest_abs, [])
                     # If one opponent token is present, capture
-                    if occ and len(occ) == 1 and occ[0][0] != player_index:
-                        opp_player_idx, opp_token_idx = occ[0]
+                    opp_player_idx = self.occ_owner[dest_abs]
+                    if self.occ_count[dest_abs] == 1 and opp_player_idx != player_index:
                         opp_player = self.players[opp_player_idx]
-                        opp_token = opp_player.tokens[opp_token_idx]
-                        opp_token.step = -1
+                        opp_steps = opp_player.steps
+                        # The captured token is the one whose step maps onto dest_abs
+                        opp_steps[opp_steps.index((dest_abs - opp_player.start_index) % self.board_length)] = -1
+                        self._leave_square(dest_abs, opp_player_idx)
                         capture_occurred = True
-                        print(f"{player.name} captures {opp_player.name}'s token at square {dest_abs}!")
+                        if self.verbose:
+                            print(f"{player.name} captures {opp_player.name}'s token at square {dest_abs}!")
                     # Move token to dest
-                    token.step = dest_step
-                    print(f"{player.name}'s token moves to square {dest_abs} (step {dest_step}).")
+                    self._enter_square(dest_abs, player_index)
+                    if self.verbose:
+                        print(f"{player.name}'s token moves to square {dest_abs} (step {dest_step}).")
             else:
                 # Move within home column (dest_step 52–57)
-                token.step = dest_step
                 if dest_step == 57:
-                    print(f"{player.name}'s token has reached the finish!")
+                    player._remaining -= 1
+                    player._active_mask &= ~(1 << token_index)
+                    if self.verbose:
+                        print(f"{player.name}'s token has reached the finish!")
                 else:
-                    print(f"{player.name}'s token moves to home square {dest_step - 52} (step {dest_step}).")
+                    if self.verbose:
+                        print(f"{player.name}'s token moves to home square {dest_step - 52} (step {dest_step}).")
         # Determine extra turn: rolling 6 or capturing
         if roll == 6 or capture_occurred:
             extra_turn = True
@@ -257,41 +351,35 @@ class LudoGameFull:
 
         The board is represented as a list of 52 squares.  Each square
         displays which tokens occupy it.  Home columns and yard tokens
-        are displayed separately for each player.
+        are displayed separately for each player.  The whole frame is
+        written to stdout in a single call.
         """
-        occupants = self.get_board_occupants()
-        # Represent main track
-        track_repr = []
-        for pos in range(self.board_length):
-            occ = occupants.get(pos, [])
-            if not occ:
-                track_repr.append(".")
-            else:
-                # Represent each occupant by the first letter of its player's colour
-                # If multiple tokens, represent by number of tokens
-                if len(occ) == 1:
-                    p_idx, _ = occ[0]
-                    track_repr.append(self.players[p_idx].colour[0].upper())
-                else:
-                    track_repr.append(str(len(occ)))
-        print("Main track (0–51):")
+        # Represent main track straight from the occupancy arrays: a single
+        # token shows the first letter of its player's colour, a stack shows
+        # the number of tokens.
+        initials = [p.colour[0].upper() for p in self.players]
+        track_repr = ["." if count == 0 else initials[owner] if count == 1 else str(count)
+                      for owner, count in zip(self.occ_owner, self.occ_count)]
+        lines: List[str] = ["Main track (0–51):"]
         # print in segments of 13 for readability
         for i in range(0, self.board_length, 13):
-            print(' '.join(track_repr[i:i+13]))
+            lines.append(' '.join(track_repr[i:i+13]))
         # Represent each player's tokens
-        for p in self.players:
-            print(f"{p.name} ({p.colour}):")
-            for idx, tok in enumerate(p.tokens):
-                if tok.in_yard:
+        for p_index, p in enumerate(self.players):
+            lines.append(f"{p.name} ({p.colour}):")
+            for idx, step in enumerate(p.steps):
+                if step < 0:
                     status = "yard"
-                elif tok.is_finished:
+                elif step == 57:
                     status = "finished"
-                elif tok.in_home:
-                    status = f"home {tok.step - 52}"
+                elif step >= 52:
+                    status = f"home {step - 52}"
                 else:
-                    abs_pos = tok.absolute_position(p.start_index, self.board_length)
-                    status = f"track pos {abs_pos} (step {tok.step})"
-                print(f"  Token {idx + 1}: {status}")
+                    abs_pos = self._abs[p_index][step]
+                    status = f"track pos {abs_pos} (step {step})"
+                lines.append(f"  Token {idx + 1}: {status}")
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
     def play(self) -> None:
         """
@@ -299,16 +387,20 @@ class LudoGameFull:
         """
         while True:
             player = self.players[self.current_player_index]
-            print(f"\n{player.name}'s turn ({player.colour}).")
+            if self.verbose:
+                print(player._turn_banner)
             extra_turn = False
             roll = self.roll_die()
-            print(f"You rolled a {roll}.")
+            if self.verbose:
+                print(f"You rolled a {roll}.")
             valid_tokens = self.get_valid_tokens_for_roll(self.current_player_index, roll)
             if not valid_tokens:
-                print("No valid moves available for this roll.")
+                if self.verbose:
+                    print("No valid moves available for this roll.")
                 # Check extra turn on 6 even if no move
                 if roll == 6:
-                    print("You rolled a 6 but cannot move. You get another roll anyway.")
+                    if self.verbose:
+                        print("You rolled a 6 but cannot move. You get another roll anyway.")
                     extra_turn = True
                 else:
                     extra_turn = False
@@ -316,22 +408,23 @@ class LudoGameFull:
                 # Ask player to choose token if multiple valid
                 if len(valid_tokens) == 1:
                     chosen_idx = valid_tokens[0]
-                    print(f"Moving token {chosen_idx + 1} automatically.")
+                    if self.verbose:
+                        print(f"Moving token {chosen_idx + 1} automatically.")
                 else:
                     print("Tokens that can move:")
                     for idx in valid_tokens:
-                        tok = player.tokens[idx]
-                        if tok.in_yard:
+                        step = player.steps[idx]
+                        if step < 0:
                             desc = "yard"
-                        elif tok.in_home:
-                            desc = f"home {tok.step - 52}"
+                        elif step >= 52:
+                            desc = f"home {step - 52}"
                         else:
-                            abs_pos = tok.absolute_position(player.start_index, self.board_length)
-                            desc = f"track pos {abs_pos} (step {tok.step})"
+                            abs_pos = self._abs[self.current_player_index][step]
+                            desc = f"track pos {abs_pos} (step {step})"
                         print(f"  {idx + 1}: {desc}")
                     while True:
                         try:
-                            choice = int(input(f"Select the token to move (1–{len(player.tokens)}): ")) - 1
+                            choice = int(input(f"Select the token to move (1–{len(player.steps)}): ")) - 1
                             if choice in valid_tokens:
                                 chosen_idx = choice
                                 break
@@ -342,16 +435,57 @@ class LudoGameFull:
                 # Move the chosen token
                 extra_turn = self.move_token(self.current_player_index, chosen_idx, roll)
             # Print board after move
-            self.print_board()
+            if self.verbose:
+                self.print_board()
             # Check if current player has won
             if player.all_finished:
-                print(f"\n{player.name} has moved all tokens home and wins the game! Congratulations!")
+                if self.verbose:
+                    print(f"\n{player.name} has moved all tokens home and wins the game! Congratulations!")
                 break
             # Decide if we move to next player
             if not extra_turn:
                 self.current_player_index = (self.current_player_index + 1) % len(self.players)
 
 
+def rollout_many(n_games: int, rng: Optional[random.Random] = None, num_players: int = 4) -> List[int]:
+    """
+    Play ``n_games`` complete games without any I/O and return their winners.
+
+    Each game is a silent :class:`LudoGameFull` in which every player moves
+    its first valid token.  This is the rollout (evaluation) step a Monte
+    Carlo tree search needs.
+
+    ``rng`` supplies the dice (a fresh :class:`random.Random` by default) so
+    runs can be reproduced.  Returns, for each game, the index of the player
+    that moved all four tokens home first.
+    """
+    if not 2 <= num_players <= 4:
+        raise ValueError(f"num_players must be between 2 and 4, got {num_players}")
+    if rng is None:
+        rng = random.Random()
+    colours = ["red", "green", "yellow", "blue"]
+    start_positions = [0, 13, 26, 39]
+    getrandbits = rng.getrandbits
+    winners: List[int] = []
+    for _ in range(n_games):
+        players = [Player(f"Player {i + 1}", colours[i], start_positions[i], (start_positions[i] - 1) % 52, 52)
+                   for i in range(num_players)]
+        game = LudoGameFull(players)
+        p_index = 0
+        while True:
+            roll = _roll_die(getrandbits)
+            extra_turn = roll == 6
+            valid_tokens = game.get_valid_tokens_for_roll(p_index, roll)
+            if valid_tokens:
+                extra_turn = game.move_token(p_index, valid_tokens[0], roll)
+                if players[p_index].all_finished:
+                    winners.append(p_index)
+                    break
+            if not extra_turn:
+                p_index = (p_index + 1) % num_players
+    return winners
+
+
 def setup_full_game() -> LudoGameFull:
     """
     Interactive setup for a full Ludo game with 2–4 players.
@@ -380,7 +514,7 @@ def setup_full_game() -> LudoGameFull:
                 break
             print("Name cannot be empty.")
         players.append(Player(name, colours[i], start_positions[i], home_entries[i], board_length))
-    return LudoGameFull(players, board_length)
+    return LudoGameFull(players, board_length, verbose=True)
 
 
 def main() -> None: